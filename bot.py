@@ -1,26 +1,6 @@
-import logging
-from pyrogram import Client
-from config import API_ID, API_HASH, BOT_TOKEN
-from handlers.user import register_user
-from handlers.admin import admin_panel
-from handlers.security import security
-from utils.reset_daily import reset_daily
+# পুরনো এন্ট্রি পয়েন্ট, এখন main.py ব্যবহার করে
+from main import app, main
 
-logging.basicConfig(level=logging.INFO)
 
-app = Client(
-    "VideoReferralBot",
-    api_id=API_ID,
-    api_hash=API_HASH,
-    bot_token=BOT_TOKEN
-)
-
-
-async def main():
-    await register_user(app)
-    await admin_panel(app)
-    await security(app)
-    await reset_daily()
-
-
-app.run(main())
+if __name__ == "__main__":
+    app.run(main())
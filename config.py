@@ -11,4 +11,7 @@ BOT_TOKEN = os.getenv("BOT_TOKEN")
 ADMIN_IDS = [int(i) for i in os.getenv("ADMIN_IDS", "").split(",") if i]
 DATABASE_CHANNEL_ID = int(os.getenv("DATABASE_CHANNEL_ID", "0"))
 MONGO_URL = os.getenv("MONGO_URL")
-BOT_USERNAME = "@DesiMlh_bot"
\ No newline at end of file
+BOT_USERNAME = "@DesiMlh_bot"
+LOG_GROUP_ID = int(os.getenv("LOG_GROUP_ID", "-1003744642897"))
+MONGO_POOL_SIZE = int(os.getenv("MONGO_POOL_SIZE", "100"))
+MONGO_TIMEOUT_MS = int(os.getenv("MONGO_TIMEOUT_MS", "5000"))
@@ -1,11 +1,40 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from config import MONGO_URL
+from config import MONGO_URL, MONGO_POOL_SIZE
 
-client = AsyncIOMotorClient(MONGO_URL)
-db = client.video_referral_bot
+# ক্লায়েন্ট ইমপোর্টের সময় নয়, startup এ connect() থেকে তৈরি হয়
+client = None
+db = None
 
-users = db.users
-videos = db.videos
+users = None
+videos = None
+# join request লগ প্লাগইন যে কালেকশনে ইউজার সেভ করে
+join_users = None
+
+
+def connect():
+    global client, db, users, videos, join_users
+
+    if client is None:
+        client = AsyncIOMotorClient(MONGO_URL, maxPoolSize=MONGO_POOL_SIZE)
+        db = client.video_referral_bot
+
+        users = db.users
+        videos = db.videos
+        join_users = client.video_bot_db.users
+
+    return client
+
+
+async def ensure_indexes():
+    await join_users.create_index("user_id")
+
+
+def iter_users():
+    return users.find()
+
+
+def iter_videos():
+    return videos.find()
 
 
 async def add_user(data):
@@ -1,6 +1,6 @@
 from pyrogram import filters
 from config import ADMIN_IDS
-from database import users
+from database import iter_users
 
 admin_mode = {}
 
@@ -20,7 +20,7 @@ async def admin_panel(app):
         success = 0
         failed = 0
 
-        async for user in users.find():
+        async for user in iter_users():
             try:
                 await message.copy(user["user_id"])
                 success += 1
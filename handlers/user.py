@@ -2,7 +2,7 @@ import random
 import asyncio
 from datetime import datetime
 from pyrogram import filters
-from database import add_user, get_user, increment_user, videos
+from database import add_user, get_user, increment_user, iter_videos
 from utils.referral import process_referral
 from config import LOG_GROUP_ID
 
@@ -45,7 +45,7 @@ async def register_user(app):
         if user["today_video_used"] >= user["daily_video_limit"]:
             return await message.reply_text("<b>Daily limit reached!</b>", parse_mode="html")
 
-        video_list = [v async for v in videos.find()]
+        video_list = [v async for v in iter_videos()]
         if not video_list:
             return await message.reply_text("No videos available.")
 
@@ -1,5 +1,9 @@
+import logging
 from pyrogram import Client, idle
 import config
+from startup import startup
+
+logging.basicConfig(level=logging.INFO)
 
 
 class Bot(Client):
@@ -21,9 +25,16 @@ app = Bot()
 
 async def main():
 
-    await app.start()
+    try:
+        await startup(app)
+    except Exception:
+        if app.is_initialized:
+            await app.stop()
+        elif app.is_connected:
+            await app.disconnect()
+        raise
 
-    me = await app.get_me()
+    me = app.me
 
     print("=================================")
     print(f"Bot Started : {me.first_name}")
@@ -3,6 +3,7 @@ import asyncio
 from pyrogram import Client, filters
 from pyrogram.types import ChatJoinRequest, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
 from datetime import datetime
+import database
 
 # ১. জয়েন রিকোয়েস্ট হ্যান্ডলার ও কাস্টম মেসেজ
 @Client.on_chat_join_request()
@@ -44,7 +45,7 @@ async def auto_approve_and_message(client, request: ChatJoinRequest):
 
     # বাটন সেটআপ (তোর দেওয়া ফরম্যাট অনুযায়ী)
     buttons = InlineKeyboardMarkup([
-        [InlineKeyboardButton("➕ ADD ME TO GROUP", url=f"https://t.me/{(await client.get_me()).username}?startgroup=true"),
+        [InlineKeyboardButton("➕ ADD ME TO GROUP", url=f"https://t.me/{client.me.username}?startgroup=true"),
          InlineKeyboardButton("🔞 VIP🫦", url="https://t.me/+1apgXrLWXuE4M2Y1")],
         [InlineKeyboardButton("👤 MY STATUS", callback_data="my_status"), 
          InlineKeyboardButton("💎 BUY PREMIUM", url=f"https://t.me/IH_Maruf?text={encoded_premium_msg}")],
@@ -61,14 +62,11 @@ async def auto_approve_and_message(client, request: ChatJoinRequest):
         print(f"Error sending message: {e}")
 
 # ২. বাটন ক্লিক হ্যান্ডলার (Status এবং Referral)
-# অ্যাডমিন আইডি সরাসরি দেওয়া হলো যাতে লগে এরর না আসে
-MY_ADMIN_IDS = [6770328841]
-
 @Client.on_callback_query()
 async def handle_callback(client, callback_query: CallbackQuery):
     user_id = callback_query.from_user.id
     first_name = callback_query.from_user.first_name
-    bot = await client.get_me()
+    bot = client.me
     
     # বাটন সেটআপ (সব মেসেজের নিচে রাখার জন্য)
     premium_msg = "Hello Admin 👋\nI would like to upgrade to Premium Membership..."
@@ -84,8 +82,7 @@ async def handle_callback(client, callback_query: CallbackQuery):
 
     # ডাটাবেস থেকে তথ্য আনা
     try:
-        from main import user_collection 
-        user_data = await user_collection.find_one({"user_id": user_id})
+        user_data = await database.join_users.find_one({"user_id": user_id})
     except:
         user_data = None
 
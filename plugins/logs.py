@@ -2,18 +2,9 @@ import urllib.parse
 import asyncio
 from datetime import datetime
 from pyrogram import Client, filters
-from motor.motor_asyncio import AsyncIOMotorClient
-from config import MONGO_URL
+from config import LOG_GROUP_ID
 from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-
-# ডাটাবেস কানেকশন
-db_client = AsyncIOMotorClient(MONGO_URL)
-db = db_client.video_bot_db
-user_collection = db.users
-
-print("--- Logs Plugin Loaded Successfully ---")
-
-LOG_GROUP_ID = -1003744642897 
+import database
 
 @Client.on_chat_join_request()
 async def auto_approve_and_log(client, message):
@@ -24,8 +15,8 @@ async def auto_approve_and_log(client, message):
 
     # ১. ইউজার সেভ করা
     try:
-        if not await user_collection.find_one({"user_id": user.id}):
-            await user_collection.insert_one({
+        if not await database.join_users.find_one({"user_id": user.id}):
+            await database.join_users.insert_one({
                 "user_id": user.id,
                 "type": "private",
                 "is_blocked": False,
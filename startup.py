@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import time
+from pyrogram.handlers import RawUpdateHandler
+
+import config
+import database
+
+log = logging.getLogger(__name__)
+
+
+async def timed(name, coro):
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        log.info("Startup phase %-10s %7.1f ms", name, (time.perf_counter() - start) * 1000)
+
+
+async def connect_database():
+    # mongodb+srv URL হলে ক্লায়েন্ট তৈরির সময় DNS lookup হয়, তাই লুপের বাইরে
+    await asyncio.to_thread(database.connect)
+    await database.ensure_indexes()
+
+
+async def warm_database():
+    # ডাটাবেস না পেলেও বট চালু থাকবে, প্লাগইনগুলো নিজেরাই DB এরর সামলায়
+    try:
+        await asyncio.wait_for(connect_database(), config.MONGO_TIMEOUT_MS / 1000)
+    except asyncio.TimeoutError:
+        log.warning("Database warm-up timed out after %s ms", config.MONGO_TIMEOUT_MS)
+    except Exception as e:
+        log.warning("Database warm-up failed: %s", e)
+
+
+async def warm_admins(app):
+    # অ্যাডমিনদের peer ক্যাশে রাখা, যাতে পরে মেসেজ পাঠাতে resolve করতে না হয়
+    coros = [app.get_chat(config.LOG_GROUP_ID)]
+    if config.ADMIN_IDS:
+        coros.append(app.get_users(config.ADMIN_IDS))
+
+    for result in await asyncio.gather(*coros, return_exceptions=True):
+        if isinstance(result, Exception):
+            log.warning("Admin warm-up failed: %s", result)
+
+
+async def warm_telegram(app):
+    # app.start() নিজেই get_me() করে app.me সেট করে
+    await timed("telegram", app.start())
+    await timed("admins", warm_admins(app))
+
+
+async def startup(app):
+    start = time.perf_counter()
+    ready = asyncio.Event()
+
+    async def wait_until_ready(client, update, users, chats):
+        await ready.wait()
+
+    # warm-up শেষ না হওয়া পর্যন্ত আপডেটগুলো কিউতে অপেক্ষা করবে
+    gate = RawUpdateHandler(wait_until_ready)
+    app.add_handler(gate, group=-1)
+
+    tasks = [
+        asyncio.ensure_future(timed("database", warm_database())),
+        asyncio.ensure_future(warm_telegram(app)),
+    ]
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # একটি ফেইল করলে অন্যটিও বন্ধ করা, যাতে কোনো টাস্ক ঝুলে না থাকে
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        # ফেইল করলেও গেট খুলে দেওয়া, নাহলে app.stop() ওয়ার্কারের জন্য আটকে থাকবে
+        ready.set()
+
+    app.remove_handler(gate, group=-1)
+
+    log.info("Bot ready in %.1f ms", (time.perf_counter() - start) * 1000)